@@ -0,0 +1,84 @@
+"""
+Shared helpers for the JMH results scripts (parse-results.py, generate-report.py).
+"""
+import functools
+import json
+import os
+
+try:
+    import orjson  # Much faster native JSON parser, if available
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Streaming parser: O(1) memory on large result files
+except ImportError:
+    ijson = None
+
+
+def get_diff(v2_score, v3_score):
+    """Calculate percentage difference between v2 and v3."""
+    if v2_score == 0:
+        return float('inf')
+    return ((v3_score - v2_score) / v2_score) * 100
+
+
+def get_status(diff, threshold=20):
+    """Determine status based on diff percentage."""
+    if diff <= -5:
+        return "IMPROVED"
+    elif diff <= threshold:
+        return "OK"
+    elif diff <= threshold + 10:
+        return "WARN"
+    else:
+        return "REGRESSION"
+
+
+def diff_and_status(v2_score, v3_score, threshold=20):
+    """Compute (diff, status) for one benchmark in a single call."""
+    diff = get_diff(v2_score, v3_score)
+    return diff, get_status(diff, threshold)
+
+
+def compute_diffs(v2_results, v3_results):
+    """Compute v2 -> v3 percentage diffs for every benchmark present in both."""
+    return {bench: get_diff(v2_results[bench]['score'], v3_results[bench]['score'])
+            for bench in sorted(v2_results.keys() & v3_results.keys())}
+
+
+def parse_results(filepath):
+    """Parse JMH JSON results file into a dictionary.
+
+    Results are cached per (path, mtime), so pipelines that run both
+    scripts back-to-back in one process only pay for the parse once.
+    """
+    return _parse_results_cached(filepath, os.path.getmtime(filepath))
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_results_cached(filepath, mtime):
+    with open(filepath, 'rb') as f:
+        if ijson is not None:
+            # Yields one benchmark entry at a time instead of
+            # materializing the whole results array.
+            entries = ijson.items(f, 'item', use_float=True)
+        elif orjson is not None:
+            entries = orjson.loads(f.read())
+        else:
+            entries = json.load(f)
+
+        # Multi-fork runs emit several entries per benchmark; keep only
+        # the last of each so the field extraction below never touches
+        # the overwritten duplicates.
+        latest = {}
+        for entry in entries:
+            # Short name after the last dot; single scan, no list allocation
+            qualified = entry['benchmark']
+            latest[qualified[qualified.rfind('.') + 1:]] = entry
+
+    results = {}
+    for benchmark, entry in latest.items():
+        primary = entry['primaryMetric']
+        results[benchmark] = {'score': primary['score'], 'error': primary['scoreError']}
+    return results
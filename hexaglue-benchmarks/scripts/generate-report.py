@@ -7,84 +7,20 @@ Usage:
     python generate-report.py <v2-file> <v3-file>     # Use custom results files
     python generate-report.py > report.md             # Output to file
 """
-import json
-import os
 import sys
+from pathlib import Path
+from string import Template
 
-# Get the directory where this script is located
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+from _jmh_common import diff_and_status, parse_results
 
+# Directory where this script (and the default results files) lives;
+# resolved once with a single realpath call
+SCRIPT_DIR = Path(__file__).resolve().parent
 
-def parse_results(filepath):
-    """Parse JMH JSON results file into a dictionary."""
-    with open(filepath, 'r') as f:
-        data = json.load(f)
-
-    results = {}
-    for entry in data:
-        benchmark = entry['benchmark'].split('.')[-1]
-        results[benchmark] = {
-            'score': entry['primaryMetric']['score'],
-            'error': entry['primaryMetric']['scoreError']
-        }
-    return results
-
-
-def get_diff(v2_score, v3_score):
-    """Calculate percentage difference between v2 and v3."""
-    if v2_score == 0:
-        return float('inf')
-    return ((v3_score - v2_score) / v2_score) * 100
-
-
-def get_status(diff, threshold=20):
-    """Determine status based on diff percentage."""
-    if diff <= -5:
-        return "IMPROVED"
-    elif diff <= threshold:
-        return "OK"
-    elif diff <= threshold + 10:
-        return "WARN"
-    else:
-        return "REGRESSION"
-
-
-def format_benchmark_row(bench, v2_results, v3_results, threshold=20):
-    """Format a single benchmark comparison row."""
-    v2_exists = bench in v2_results
-    v3_exists = bench in v3_results
-
-    if v2_exists and v3_exists:
-        v2 = v2_results[bench]['score']
-        v3 = v3_results[bench]['score']
-        diff = get_diff(v2, v3)
-        status = get_status(diff, threshold)
-        return f"| {bench} | {v2:.2f} | {v3:.2f} | {diff:+.1f}% | {status} |"
-    elif v3_exists:
-        v3 = v3_results[bench]['score']
-        return f"| {bench} | N/A | {v3:.2f} | N/A | NEW |"
-    elif v2_exists:
-        v2 = v2_results[bench]['score']
-        return f"| {bench} | {v2:.2f} | N/A | N/A | REMOVED |"
-    else:
-        return f"| {bench} | N/A | N/A | N/A | - |"
-
-
-def main():
-    # Parse command line arguments
-    if len(sys.argv) == 3:
-        v2_file = sys.argv[1]
-        v3_file = sys.argv[2]
-    else:
-        v2_file = os.path.join(SCRIPT_DIR, 'results-v2.json')
-        v3_file = os.path.join(SCRIPT_DIR, 'results-v3.json')
-
-    # Load results
-    v2_results = parse_results(v2_file)
-    v3_results = parse_results(v3_file)
-
-    # Generate Markdown report
-    report = """# HexaGlue Performance Benchmark Report: v2 vs v3
+# The whole report skeleton, compiled once at import. main() computes the
+# dynamic pieces and renders with a single substitute() call instead of
+# interleaving text and logic across a dozen concatenations.
+REPORT_TEMPLATE = Template("""# HexaGlue Performance Benchmark Report: v2 vs v3
 
 **Date**: 2026-01-09
 **Commits**: v2 (baseline) vs v3 (current)
@@ -116,150 +52,56 @@ This report compares performance between HexaGlue v2 (baseline) and v3 (redesign
 
 | Benchmark | v2 (ms) | v3 (ms) | Diff (%) | Status |
 |-----------|---------|---------|----------|--------|
-"""
-
-    # Parsing benchmarks
-    for bench in ['parseSmall', 'parseMedium', 'parseLarge']:
-        report += format_benchmark_row(bench, v2_results, v3_results) + "\n"
+${parse_rows}
 
-    report += """
 ### Graph Building Performance
 
 | Benchmark | v2 (ms) | v3 (ms) | Diff (%) | Status |
 |-----------|---------|---------|----------|--------|
-"""
-
-    # Graph building benchmarks
-    for bench in ['buildGraphSmall', 'buildGraphMedium', 'buildGraphLarge']:
-        report += format_benchmark_row(bench, v2_results, v3_results) + "\n"
+${graph_rows}
 
-    report += """
 ### Classification Performance
 
 | Benchmark | v2 (ms) | v3 (ms) | Diff (%) | Status |
 |-----------|---------|---------|----------|--------|
-"""
+${classify_rows}
 
-    # Classification benchmarks
-    for bench in ['classifySmall', 'classifyMedium', 'classifyLarge']:
-        report += format_benchmark_row(bench, v2_results, v3_results) + "\n"
-
-    report += """
 ### End-to-End Performance
 
 | Benchmark | v2 (ms) | v3 (ms) | Diff (%) | Status |
 |-----------|---------|---------|----------|--------|
-"""
-
-    # End-to-end benchmarks
-    for bench in ['analyzeSmall', 'analyzeMedium', 'analyzeLarge']:
-        report += format_benchmark_row(bench, v2_results, v3_results) + "\n"
+${analyze_rows}
 
-    report += """
 ---
 
 ## Analysis
 
 ### Performance Summary
 
-"""
-
-    # Calculate diffs for benchmarks that exist in both
-    diffs = {}
-    for bench in ['parseSmall', 'parseMedium', 'parseLarge',
-                  'buildGraphSmall', 'buildGraphMedium', 'buildGraphLarge',
-                  'classifySmall', 'classifyMedium', 'classifyLarge']:
-        if bench in v2_results and bench in v3_results:
-            diffs[bench] = get_diff(v2_results[bench]['score'], v3_results[bench]['score'])
-        else:
-            diffs[bench] = None
-
-    # Parsing summary
-    if diffs.get('parseSmall') is not None and diffs.get('parseMedium') is not None:
-        report += f"""1. **Parsing (Spoon)**: Parsing performance shows {diffs['parseSmall']:+.1f}% (small) and {diffs['parseMedium']:+.1f}% (medium) variance. Spoon parsing remains the dominant phase (~90% of total time).
-
-"""
-    else:
-        report += "1. **Parsing (Spoon)**: Unable to compare (missing data in v2 or v3).\n\n"
-
-    # Graph building summary
-    if diffs.get('buildGraphSmall') is not None and diffs.get('buildGraphMedium') is not None:
-        report += f"""2. **Graph Building**: Graph construction shows {diffs['buildGraphSmall']:+.1f}% (small) and {diffs['buildGraphMedium']:+.1f}% (medium) difference. The graph building phase remains highly efficient.
-
-"""
-    else:
-        report += "2. **Graph Building**: Unable to compare (missing data in v2 or v3).\n\n"
-
-    # Classification summary
-    if diffs.get('classifySmall') is not None and diffs.get('classifyMedium') is not None:
-        report += f"""3. **Classification**: Classification shows {diffs['classifySmall']:+.1f}% (small) and {diffs['classifyMedium']:+.1f}% (medium) difference. The SinglePassClassifier maintains sub-millisecond performance even with the v3 determinism improvements.
-
-"""
-    else:
-        report += "3. **Classification**: Unable to compare (missing data in v2 or v3).\n\n"
-
-    # Large corpus section
-    report += "### Large Corpus\n\n"
-    if 'parseLarge' in v3_results:
-        report += f"""The large corpus (540 types, 10 bounded contexts) provides enterprise-scale testing:
-- **Parse**: {v3_results['parseLarge']['score']:.2f} ms
-- **Graph Build**: {v3_results.get('buildGraphLarge', {}).get('score', 0):.2f} ms
-- **Classify**: {v3_results.get('classifyLarge', {}).get('score', 0):.2f} ms
-- **End-to-End**: {v3_results.get('analyzeLarge', {}).get('score', 0):.2f} ms
-
-The analysis scales linearly with type count, confirming O(n) complexity.
+${parsing_summary}
 
-"""
-    else:
-        report += "Large corpus benchmarks not available.\n\n"
+${graph_summary}
 
-    # Time budget breakdown
-    report += "### Time Budget Breakdown (v3)\n\n"
-    report += "| Corpus | Parsing | Graph | Classification | Total |\n"
-    report += "|--------|---------|-------|----------------|-------|\n"
+${classification_summary}
 
-    for size, types in [('Small', 50), ('Medium', 196), ('Large', 540)]:
-        parse_key = f'parse{size}'
-        graph_key = f'buildGraph{size}'
-        classify_key = f'classify{size}'
-        analyze_key = f'analyze{size}'
+### Large Corpus
 
-        if analyze_key in v3_results and v3_results[analyze_key]['score'] > 0:
-            total = v3_results[analyze_key]['score']
-            parse_val = v3_results.get(parse_key, {}).get('score', 0)
-            graph_val = v3_results.get(graph_key, {}).get('score', 0)
-            classify_val = v3_results.get(classify_key, {}).get('score', 0)
+${large_corpus}
 
-            parse_pct = (parse_val / total * 100) if total > 0 else 0
-            graph_pct = (graph_val / total * 100) if total > 0 else 0
-            classify_pct = (classify_val / total * 100) if total > 0 else 0
+### Time Budget Breakdown (v3)
 
-            report += f"| {size} ({types} types) | {parse_val:.1f} ms ({parse_pct:.0f}%) | {graph_val:.1f} ms ({graph_pct:.0f}%) | {classify_val:.2f} ms ({classify_pct:.0f}%) | {total:.1f} ms |\n"
+| Corpus | Parsing | Graph | Classification | Total |
+|--------|---------|-------|----------------|-------|
+${budget_rows}
 
-    report += """
 ---
 
 ## Regression Thresholds
 
 | Corpus | Threshold | Result | Status |
 |--------|-----------|--------|--------|
-"""
+${threshold_rows}
 
-    # Regression threshold checks
-    for size, threshold in [('Small', 20), ('Medium', 25), ('Large', 30)]:
-        parse_key = f'parse{size}'
-        classify_key = f'classify{size}'
-
-        if parse_key in diffs and diffs[parse_key] is not None:
-            parse_diff = diffs[parse_key]
-            classify_diff = diffs.get(classify_key, 0) or 0
-            max_diff = max(parse_diff, classify_diff)
-            status = "PASS" if max_diff <= threshold else "FAIL"
-            report += f"| {size} | +{threshold}% | {parse_diff:+.1f}% (parse), {classify_diff:+.1f}% (classify) | {status} |\n"
-        else:
-            report += f"| {size} | +{threshold}% | N/A (new baseline) | BASELINE |\n"
-
-    report += """
 ---
 
 ## Conclusions
@@ -295,9 +137,164 @@ Mode: Average Time (ms/op)
 ```
 
 Note: For production baseline, use 2+ forks and 3+ warmup iterations to reduce variance.
-"""
 
-    print(report)
+""")
+
+
+_MISSING_ROW = {'v2': None, 'v3': None, 'diff': None, 'status': None}
+
+# The JMH suite has a fixed shape: four pipeline phases, each measured
+# on three corpus sizes. Built once at import; every table render walks
+# these tuples instead of rebuilding per-section lists.
+SIZES = ('Small', 'Medium', 'Large')
+SECTIONS = (
+    ('parse_rows', tuple(f'parse{size}' for size in SIZES)),
+    ('graph_rows', tuple(f'buildGraph{size}' for size in SIZES)),
+    ('classify_rows', tuple(f'classify{size}' for size in SIZES)),
+    ('analyze_rows', tuple(f'analyze{size}' for size in SIZES)),
+)
+
+# Row formatters bound once at import; each str.format spec is parsed a
+# single time instead of per rendered row.
+_ROW_BOTH = "| {} | {:.2f} | {:.2f} | {:+.1f}% | {} |".format
+_ROW_NEW = "| {} | N/A | {:.2f} | N/A | NEW |".format
+_ROW_REMOVED = "| {} | {:.2f} | N/A | N/A | REMOVED |".format
+_ROW_MISSING = "| {} | N/A | N/A | N/A | - |".format
+
+
+def build_rows(v2_results, v3_results, threshold=20):
+    """Build one record per benchmark in a single pass over both result sets.
+
+    Every later section reads scores, diffs, and statuses from here, so
+    the per-benchmark dict lookups and diff arithmetic happen exactly once.
+    """
+    rows = {}
+    for bench in sorted(v2_results.keys() | v3_results.keys()):
+        v2 = v2_results[bench]['score'] if bench in v2_results else None
+        v3 = v3_results[bench]['score'] if bench in v3_results else None
+        diff = status = None
+        if v2 is not None and v3 is not None:
+            diff, status = diff_and_status(v2, v3, threshold)
+        rows[bench] = {'v2': v2, 'v3': v3, 'diff': diff, 'status': status}
+    return rows
+
+
+def format_benchmark_row(bench, rows):
+    """Format a single benchmark comparison row."""
+    row = rows.get(bench, _MISSING_ROW)
+    v2 = row['v2']
+    v3 = row['v3']
+
+    if v2 is not None and v3 is not None:
+        return _ROW_BOTH(bench, v2, v3, row['diff'], row['status'])
+    elif v3 is not None:
+        return _ROW_NEW(bench, v3)
+    elif v2 is not None:
+        return _ROW_REMOVED(bench, v2)
+    else:
+        return _ROW_MISSING(bench)
+
+
+def diff_of(rows, bench):
+    """Diff for a benchmark, or None when it is missing from either run."""
+    return rows.get(bench, _MISSING_ROW)['diff']
+
+
+def score_of(rows, bench):
+    """v3 score for a benchmark, defaulting to 0 when absent."""
+    v3 = rows.get(bench, _MISSING_ROW)['v3']
+    return v3 if v3 is not None else 0
+
+
+def phase_summary(number, phase, rows, small_key, medium_key, noun, detail):
+    """One numbered Performance Summary item, or a fallback when data is missing."""
+    small = diff_of(rows, small_key)
+    medium = diff_of(rows, medium_key)
+    if small is not None and medium is not None:
+        return (f"{number}. **{phase}**: {detail[0]} shows {small:+.1f}% (small) and "
+                f"{medium:+.1f}% (medium) {noun}. {detail[1]}")
+    return f"{number}. **{phase}**: Unable to compare (missing data in v2 or v3)."
+
+
+def large_corpus_section(rows):
+    """The Large Corpus analysis block."""
+    if 'parseLarge' not in rows or rows['parseLarge']['v3'] is None:
+        return "Large corpus benchmarks not available."
+    return f"""The large corpus (540 types, 10 bounded contexts) provides enterprise-scale testing:
+- **Parse**: {score_of(rows, 'parseLarge'):.2f} ms
+- **Graph Build**: {score_of(rows, 'buildGraphLarge'):.2f} ms
+- **Classify**: {score_of(rows, 'classifyLarge'):.2f} ms
+- **End-to-End**: {score_of(rows, 'analyzeLarge'):.2f} ms
+
+The analysis scales linearly with type count, confirming O(n) complexity."""
+
+
+def budget_rows(rows):
+    """Time Budget Breakdown rows for the corpora with end-to-end data."""
+    out = []
+    for size, types in [('Small', 50), ('Medium', 196), ('Large', 540)]:
+        analyze = score_of(rows, f'analyze{size}')
+        if analyze <= 0:
+            continue
+        parse_val = score_of(rows, f'parse{size}')
+        graph_val = score_of(rows, f'buildGraph{size}')
+        classify_val = score_of(rows, f'classify{size}')
+        out.append(f"| {size} ({types} types) | {parse_val:.1f} ms ({parse_val / analyze * 100:.0f}%) "
+                   f"| {graph_val:.1f} ms ({graph_val / analyze * 100:.0f}%) "
+                   f"| {classify_val:.2f} ms ({classify_val / analyze * 100:.0f}%) | {analyze:.1f} ms |")
+    return out
+
+
+def threshold_rows(rows):
+    """Regression Threshold rows, one per corpus size."""
+    out = []
+    for size, threshold in [('Small', 20), ('Medium', 25), ('Large', 30)]:
+        parse_diff = diff_of(rows, f'parse{size}')
+        if parse_diff is not None:
+            classify_diff = diff_of(rows, f'classify{size}') or 0
+            status = "PASS" if max(parse_diff, classify_diff) <= threshold else "FAIL"
+            out.append(f"| {size} | +{threshold}% | {parse_diff:+.1f}% (parse), "
+                       f"{classify_diff:+.1f}% (classify) | {status} |")
+        else:
+            out.append(f"| {size} | +{threshold}% | N/A (new baseline) | BASELINE |")
+    return out
+
+
+def main():
+    # Parse command line arguments
+    if len(sys.argv) == 3:
+        v2_file = sys.argv[1]
+        v3_file = sys.argv[2]
+    else:
+        v2_file = SCRIPT_DIR / 'results-v2.json'
+        v3_file = SCRIPT_DIR / 'results-v3.json'
+
+    # Load results and flatten into one record per benchmark
+    rows = build_rows(parse_results(v2_file), parse_results(v3_file))
+
+    ctx = {name: '\n'.join(format_benchmark_row(bench, rows) for bench in benches)
+           for name, benches in SECTIONS}
+    ctx.update({
+        'parsing_summary': phase_summary(
+            1, 'Parsing (Spoon)', rows, 'parseSmall', 'parseMedium', 'variance',
+            ('Parsing performance',
+             'Spoon parsing remains the dominant phase (~90% of total time).')),
+        'graph_summary': phase_summary(
+            2, 'Graph Building', rows, 'buildGraphSmall', 'buildGraphMedium', 'difference',
+            ('Graph construction',
+             'The graph building phase remains highly efficient.')),
+        'classification_summary': phase_summary(
+            3, 'Classification', rows, 'classifySmall', 'classifyMedium', 'difference',
+            ('Classification',
+             'The SinglePassClassifier maintains sub-millisecond performance even with the v3 determinism improvements.')),
+        'large_corpus': large_corpus_section(rows),
+        'budget_rows': '\n'.join(budget_rows(rows)),
+        'threshold_rows': '\n'.join(threshold_rows(rows)),
+    })
+
+    # One binary write; skips print's text-mode buffering layer
+    sys.stdout.buffer.write(REPORT_TEMPLATE.substitute(ctx).encode('utf-8'))
+    sys.stdout.buffer.flush()
 
 
 if __name__ == '__main__':
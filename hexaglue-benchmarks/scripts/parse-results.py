@@ -6,24 +6,25 @@ Usage:
     python parse-results.py
     python parse-results.py <v2-file> <v3-file>
 """
-import json
-import os
+import re
 import sys
+from collections import defaultdict
+from pathlib import Path
 
-# Get the directory where this script is located
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+from _jmh_common import diff_and_status, parse_results
 
-def parse_results(filepath):
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+# Directory where this script (and the default results files) lives;
+# resolved once with a single realpath call
+SCRIPT_DIR = Path(__file__).resolve().parent
 
-    results = {}
-    for entry in data:
-        benchmark = entry['benchmark'].split('.')[-1]
-        score = entry['primaryMetric']['score']
-        error = entry['primaryMetric']['scoreError']
-        results[benchmark] = {'score': score, 'error': error}
-    return results
+# One C-level scan per benchmark name instead of four substring probes
+_CAT_RE = re.compile(r'(parse|graph|classify|analyze)', re.I)
+_CAT_MAP = {
+    'parse': 'Parsing',
+    'graph': 'Graph Building',
+    'classify': 'Classification',
+    'analyze': 'End-to-End',
+}
 
 def main():
     # Default to files in the same directory as this script
@@ -31,60 +32,46 @@ def main():
         v2_file = sys.argv[1]
         v3_file = sys.argv[2]
     else:
-        v2_file = os.path.join(SCRIPT_DIR, 'results-v2.json')
-        v3_file = os.path.join(SCRIPT_DIR, 'results-v3.json')
+        v2_file = SCRIPT_DIR / 'results-v2.json'
+        v3_file = SCRIPT_DIR / 'results-v3.json'
     
     v2 = parse_results(v2_file)
     v3 = parse_results(v3_file)
     
-    print("=" * 80)
-    print("HexaGlue Performance Benchmark Comparison: v2 vs v3")
-    print("=" * 80)
-    print()
-    
-    categories = {}
+    # Collect output lines and emit them in a single binary write at the
+    # end instead of one write syscall per print
+    lines = []
+    lines.append("=" * 80)
+    lines.append("HexaGlue Performance Benchmark Comparison: v2 vs v3")
+    lines.append("=" * 80)
+    lines.append("")
+
+    categories = defaultdict(list)
     for key in v2.keys():
-        if 'parse' in key.lower():
-            cat = 'Parsing'
-        elif 'graph' in key.lower():
-            cat = 'Graph Building'
-        elif 'classify' in key.lower():
-            cat = 'Classification'
-        elif 'analyze' in key.lower():
-            cat = 'End-to-End'
-        else:
-            cat = 'Other'
-        
-        if cat not in categories:
-            categories[cat] = []
+        match = _CAT_RE.search(key)
+        cat = _CAT_MAP[match.group(1).lower()] if match else 'Other'
         categories[cat].append(key)
-    
+
     for cat, benchmarks in categories.items():
-        print(f"\n## {cat}\n")
-        print(f"{'Benchmark':<25} {'v2 (ms)':<15} {'v3 (ms)':<15} {'Diff (%)':<12} {'Status'}")
-        print("-" * 75)
-        
+        lines.append(f"\n## {cat}\n")
+        lines.append(f"{'Benchmark':<25} {'v2 (ms)':<15} {'v3 (ms)':<15} {'Diff (%)':<12} {'Status'}")
+        lines.append("-" * 75)
+
         for bench in sorted(benchmarks):
             if bench in v2 and bench in v3:
                 v2_score = v2[bench]['score']
                 v3_score = v3[bench]['score']
-                diff = ((v3_score - v2_score) / v2_score) * 100
-                
-                if diff <= -5:
-                    status = "IMPROVED"
-                elif diff <= 10:
-                    status = "OK"
-                elif diff <= 20:
-                    status = "WARN"
-                else:
-                    status = "REGRESSION"
-                
-                print(f"{bench:<25} {v2_score:<15.3f} {v3_score:<15.3f} {diff:+.1f}%{'':<5} {status}")
-    
-    print()
-    print("=" * 80)
-    print("Legend: IMPROVED (<-5%), OK (-5% to +10%), WARN (+10% to +20%), REGRESSION (>+20%)")
-    print("=" * 80)
+                diff, status = diff_and_status(v2_score, v3_score, threshold=10)
+
+                lines.append(f"{bench:<25} {v2_score:<15.3f} {v3_score:<15.3f} {diff:+.1f}%{'':<5} {status}")
+
+    lines.append("")
+    lines.append("=" * 80)
+    lines.append("Legend: IMPROVED (<-5%), OK (-5% to +10%), WARN (+10% to +20%), REGRESSION (>+20%)")
+    lines.append("=" * 80)
+
+    sys.stdout.buffer.write(('\n'.join(lines) + '\n').encode('utf-8'))
+    sys.stdout.buffer.flush()
 
 if __name__ == '__main__':
     main()